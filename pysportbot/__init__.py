@@ -1,33 +1,64 @@
 # pysportbot/sportbot.py
 
-import logging
+from __future__ import annotations
 
-from pandas import DataFrame
+import contextlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-from .activities import Activities
 from .authenticator import Authenticator
 from .bookings import Bookings
-from .centres import Centres
+from .endpoints import Endpoints
 from .session import Session
-from .utils.errors import ErrorMessages
+from .utils.errors import (
+    ErrorMessages,
+    SlotAlreadyBookedError,
+    SlotCapacityFullError,
+    SlotNotBookableYetError,
+    SlotUnavailableError,
+)
 from .utils.logger import set_log_level, setup_logger
 
+# pandas and the pandas-backed Centres and Activities are imported on first use,
+# so that importing the package (e.g. for pysportbot.utils) does not pay for them
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from .activities import Activities
+
 
 class SportBot:
     """Unified interface for interacting with the booking system."""
 
+    # How long (in seconds) the activity catalogue is reused across logins to the same centre
+    ACTIVITIES_TTL: float = 6 * 60 * 60
+
     def __init__(self, log_level: str = "INFO", print_centres: bool = False, time_zone: str = "Europe/Madrid") -> None:
         setup_logger(log_level, timezone=time_zone)
         self._logger = logging.getLogger("SportBot")
         self._logger.info("Initializing SportBot...")
         self._logger.info(f"Log level: {log_level}")
         self._logger.info(f"Time zone: {time_zone}")
-        self._centres = Centres(print_centres)
+        from .centres import Centres
+
         self._session: Session = Session()
+        self._centres = Centres(print_centres, session=self._session)
         self._auth: Authenticator | None = None
         self._activities: Activities | None = None
         self._bookings: Bookings | None = None
         self._df_activities: DataFrame | None = None
+        # Centre and monotonic time of the last activity catalogue fetch
+        self._activities_centre: str | None = None
+        self._activities_fetched_at: float | None = None
+        # Last non-empty daily slots per (activity, day) as plain records keyed by
+        # start time, so book/cancel look a slot up without touching pandas
+        self._slots_cache: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+        # Per (activity, day) locks so parallel bookings share a single slots fetch
+        self._slots_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._slots_locks_guard = threading.Lock()
         self._is_logged_in: bool = False
 
     @property
@@ -38,6 +69,8 @@ class SportBot:
 
         # Lazy initialization - create only when first needed
         if self._activities is None:
+            from .activities import Activities
+
             self._activities = Activities(self._auth)
         return self._activities
 
@@ -63,16 +96,37 @@ class SportBot:
 
         # Initialize the Authenticator
         self._auth = Authenticator(self._session, centre)
+        # Managers hold the previous login's credentials; recreate them on demand
+        self._activities = None
+        self._bookings = None
+        # Slots fetched under a previous login may be outdated, and their fetch
+        # locks would otherwise accumulate for every day ever looked up
+        self._slots_cache.clear()
+        with self._slots_locks_guard:
+            self._slots_locks.clear()
 
         self._logger.info("Attempting to log in...")
         try:
-            # Login to get valid credentials
-            self._auth.login(email, password)
+            # Login to get valid credentials; the user lookup is deferred
+            # so it can overlap with the activities fetch below
+            self._auth.login(email, password, verify_user=False)
             self._is_logged_in = True
-            self._logger.info("Login successful!")
 
-            # Fetch activities on first successful login
-            self._df_activities = self.activities_manager.fetch()
+            if self._has_recent_activities(centre):
+                # Re-login to the same centre: the catalogue is still fresh
+                self._auth.verify_user()
+                self._logger.info("Login successful!")
+                self._logger.debug("Reusing previously fetched activities.")
+            else:
+                # Both requests only need the Nubapp JWT, so issue them concurrently
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    verify_future = executor.submit(self._auth.verify_user)
+                    activities_future = executor.submit(self.activities_manager.fetch)
+                    verify_future.result()
+                    self._logger.info("Login successful!")
+                    self._df_activities = activities_future.result()
+                self._activities_centre = centre
+                self._activities_fetched_at = time.monotonic()
         except Exception:
             self._is_logged_in = False
             # Clean up on failure
@@ -82,6 +136,19 @@ class SportBot:
             self._logger.exception(ErrorMessages.login_failed())
             raise
 
+    def _has_recent_activities(self, centre: str) -> bool:
+        """Check whether the loaded activities belong to the centre and are within ACTIVITIES_TTL."""
+        return (
+            self._df_activities is not None
+            and self._activities_centre == centre
+            and self._activities_fetched_at is not None
+            and time.monotonic() - self._activities_fetched_at < self.ACTIVITIES_TTL
+        )
+
+    def warm_up(self) -> None:
+        """Open a connection to the booking API ahead of time so that the next booking skips the TLS handshake."""
+        self._session.warm_up(Endpoints.BASE_NUBAPP)
+
     def is_logged_in(self) -> bool:
         """Returns the login status."""
         return self._is_logged_in
@@ -91,33 +158,94 @@ class SportBot:
             raise ValueError(ErrorMessages.no_activities_loaded())
 
         df = self._df_activities[["name_activity", "id_activity"]]
-        return df.head(limit) if limit else df
+        return df.iloc[:limit] if limit else df
 
     def daily_slots(self, activity: str, day: str, limit: int | None = None) -> DataFrame:
         if self._df_activities is None:
             raise ValueError(ErrorMessages.no_activities_loaded())
 
         df = self.activities_manager.daily_slots(self._df_activities, activity, day)
-        return df.head(limit) if limit else df
+        if df.empty:
+            self._slots_cache.pop((activity, day), None)
+        else:
+            records = df.drop_duplicates(subset="start_timestamp").to_dict("records")
+            self._slots_cache[(activity, day)] = {record["start_timestamp"]: record for record in records}
+        return df.iloc[:limit] if limit else df
 
-    def book(self, activity: str, start_time: str) -> None:
-        if self._df_activities is None:
-            raise ValueError(ErrorMessages.no_activities_loaded())
+    def _find_slot(self, activity: str, start_time: str, refresh: bool = False) -> dict[str, Any]:
+        """
+        Find the slot of an activity starting at the given time.
 
-        # Fetch the daily slots for the activity
-        slots = self.daily_slots(activity, start_time.split(" ")[0])
+        Cached daily slots are used when available; a miss in the cache is
+        retried against freshly fetched slots before giving up. Concurrent
+        misses for the same activity and day wait for a single fetch.
 
-        # Find the slot that matches the start time
-        matching_slot = slots[slots["start_timestamp"] == start_time]
+        Args:
+            activity (str): The name of the activity.
+            start_time (str): The slot start time in 'YYYY-MM-DD HH:MM:SS' format.
+            refresh (bool): Whether to bypass the cache and fetch the slots again.
 
-        # If no matching slot is found, raise an error
-        if matching_slot.empty:
+        Returns:
+            dict[str, Any]: The matching slot record.
+
+        Raises:
+            IndexError: If no slot starts at the given time.
+        """
+        key = (activity, start_time.split(" ")[0])
+
+        cached_slots = self._slots_cache.get(key)
+        slots = None if refresh else cached_slots
+        if slots is None or start_time not in slots:
+            with self._slots_lock(key):
+                slots = self._slots_cache.get(key)
+                # Fetch unless another thread refreshed the slots while we waited
+                if slots is None or slots is cached_slots or start_time not in slots:
+                    self.daily_slots(*key)
+                    slots = self._slots_cache.get(key)
+
+        if slots is None or start_time not in slots:
             error_msg = ErrorMessages.slot_not_found(activity, start_time)
             self._logger.error(error_msg)
             raise IndexError(error_msg)
 
+        return slots[start_time]
+
+    def _slots_lock(self, key: tuple[str, str]) -> threading.Lock:
+        """Return the lock guarding slot fetches for an (activity, day) pair."""
+        with self._slots_locks_guard:
+            return self._slots_locks.setdefault(key, threading.Lock())
+
+    def book(self, activity: str, start_time: str) -> None:
+        # Booking errors reported by the server are logged by _book rather than raised
+        with contextlib.suppress(SlotAlreadyBookedError, SlotUnavailableError, SlotNotBookableYetError):
+            self._book(activity, start_time)
+
+    def _book(self, activity: str, start_time: str) -> None:
+        """
+        Book the slot of an activity starting at the given time.
+
+        Unlike book, booking errors reported by the server are raised, so that
+        the booking service can tell whether and how to retry.
+
+        Raises:
+            SlotCapacityFullError: If the slot is booked out.
+            SlotAlreadyBookedError: If the slot is already booked.
+            SlotUnavailableError: If the slot is not available.
+            SlotNotBookableYetError: If the slot is not bookable yet.
+        """
+        if self._df_activities is None:
+            raise ValueError(ErrorMessages.no_activities_loaded())
+
+        slot_key = (activity, start_time.split(" ")[0])
+        from_cache = slot_key in self._slots_cache
+
         # The targeted slot
-        target_slot = matching_slot.iloc[0]
+        target_slot = self._find_slot(activity, start_time)
+
+        # Cached capacity may be outdated, so confirm a full slot with the server
+        if from_cache and target_slot["n_inscribed"] >= target_slot["n_capacity"]:
+            target_slot = self._find_slot(activity, start_time, refresh=True)
+
         # The unique slot ID
         slot_id = target_slot["id_activity_calendar"]
         # The total member capacity of the slot
@@ -132,14 +260,24 @@ class SportBot:
         # Check if the slot is already booked out
         if slot_n_inscribed >= slot_capacity:
             self._logger.error(f"Activity '{activity}' on {start_time} with ID {slot_id} is booked out...")
-            raise ValueError(ErrorMessages.slot_capacity_full())
+            raise SlotCapacityFullError(ErrorMessages.slot_capacity_full())
 
         # Attempt to book the slot
         try:
             self.bookings_manager.book(slot_id)
+            # Slot occupancy changed, so the cached slots are outdated
+            self._slots_cache.pop(slot_key, None)
             self._logger.info(f"Successfully booked class '{activity}' on {start_time}")
-        except ValueError:
-            self._logger.error(f"Failed to book class '{activity}' on {start_time}")
+        except ValueError as exc:
+            # Apart from a slot that is not open yet, a failure may mean its occupancy
+            # changed, so the next attempt should look at freshly fetched slots
+            if isinstance(exc, SlotNotBookableYetError):
+                # Expected while polling for the booking window to open
+                self._logger.debug(f"Class '{activity}' on {start_time} is not bookable yet")
+            else:
+                self._slots_cache.pop(slot_key, None)
+                self._logger.error(f"Failed to book class '{activity}' on {start_time}")
+            raise
 
     def cancel(self, activity: str, start_time: str) -> None:
         self._logger.debug(f"Attempting to cancel class '{activity}' on {start_time}")
@@ -147,16 +285,11 @@ class SportBot:
         if self._df_activities is None:
             raise ValueError(ErrorMessages.no_activities_loaded())
 
-        slots = self.daily_slots(activity, start_time.split(" ")[0])
-        matching_slot = slots[slots["start_timestamp"] == start_time]
-        if matching_slot.empty:
-            error_msg = ErrorMessages.slot_not_found(activity, start_time)
-            self._logger.error(error_msg)
-            raise IndexError(error_msg)
-
-        slot_id = matching_slot.iloc[0]["id_activity_calendar"]
+        slot_id = self._find_slot(activity, start_time)["id_activity_calendar"]
         try:
             self.bookings_manager.cancel(slot_id)
+            # Slot occupancy changed, so the cached slots are outdated
+            self._slots_cache.pop((activity, start_time.split(" ")[0]), None)
             self._logger.info(f"Successfully cancelled class '{activity}' on {start_time}")
         except ValueError:
             self._logger.error(f"Failed to cancel class '{activity}' on {start_time}")
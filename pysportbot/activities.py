@@ -65,7 +65,7 @@ class Activities:
             raise RuntimeError(error_msg)
 
         try:
-            data = json.loads(response.content.decode("utf-8"))
+            data = response.json()
             activities = data["data"]["activities_calendar"]
 
             if not activities:
@@ -86,12 +86,12 @@ class Activities:
         except json.JSONDecodeError as err:
             error_msg = "Invalid JSON response while fetching activities from slots."
             logger.error(error_msg)
-            logger.error(f"Raw response: {response.content.decode('utf-8')}")
+            logger.error(f"Raw response: {response.text}")
             raise RuntimeError(error_msg) from err
         except KeyError as err:
             error_msg = f"Missing expected key in response: {err}"
             logger.error(error_msg)
-            logger.error(f"Raw response: {response.content.decode('utf-8')}")
+            logger.error(f"Raw response: {response.text}")
             raise RuntimeError(error_msg) from err
         except Exception as err:
             error_msg = f"Unexpected error while parsing activities: {err}"
@@ -120,15 +120,16 @@ class Activities:
         logger.info(f"Fetching available slots for '{activity_name}' on {day}...")
 
         # Check if the activity exists
-        activity_match = df_activities[df_activities["name_activity"] == activity_name]
-        if activity_match.empty:
+        is_match = (df_activities["name_activity"] == activity_name).to_numpy()
+        if not is_match.any():
             error_msg = ErrorMessages.activity_not_found(
                 activity_name, df_activities["name_activity"].unique().tolist()
             )
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        activity = activity_match.iloc[0]
+        # Read the first matching row by position instead of building a filtered frame
+        activity = df_activities.iloc[is_match.argmax()]
         id_activity = activity["id_activity"]
         id_category_activity = activity["id_category_activity"]
 
@@ -151,7 +152,7 @@ class Activities:
             raise RuntimeError(error_msg)
 
         try:
-            data = json.loads(response.content.decode("utf-8"))
+            data = response.json()
             slots = data["data"]["activities_calendar"]
         except json.JSONDecodeError as err:
             error_msg = "Invalid JSON response while fetching slots."
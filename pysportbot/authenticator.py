@@ -1,4 +1,7 @@
+import base64
 import json
+import time
+from typing import NoReturn
 
 from .endpoints import Endpoints
 from .session import Session
@@ -8,6 +11,17 @@ from .utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _jwt_expiry(token: str) -> float | None:
+    """Return the expiry (Unix time) from a JWT's "exp" claim, or None if it cannot be read."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
 class Authenticator:
     """
     Handles user authentication and Nubapp login functionality.
@@ -52,12 +66,14 @@ class Authenticator:
         # Nubapp JWT tokens used for authenticated sport.nubapp.com requests
         self.sport_jwt: str | None = None
         self.sport_refresh: str | None = None
+        # Expiry (Unix time) of the Nubapp JWT, if the token carries one
+        self.sport_jwt_expires_at: float | None = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def login(self, email: str, password: str) -> None:
+    def login(self, email: str, password: str, verify_user: bool = True) -> None:
         """
         Full login flow:
 
@@ -65,6 +81,13 @@ class Authenticator:
           2. Fill self.creds with (id_application, id_user) for Activities
           3. /secure/user/getSportUserToken -> Nubapp JWT
           4. Store Nubapp JWT in headers and fetch user info to confirm identity
+
+        Args:
+            email (str): Account email.
+            password (str): Account password.
+            verify_user (bool): Whether to run step 4's user lookup here. Callers that
+                want to overlap it with other Nubapp requests can pass False and call
+                verify_user() themselves once the Authorization header is set.
         """
         logger.info("Starting login process...")
 
@@ -79,25 +102,44 @@ class Authenticator:
 
             self._get_sport_user_token()
             self._authenticate_with_bearer_token(self.sport_jwt)
-            self._fetch_user_information()
 
-            self.authenticated = True
-            logger.info("Login process completed successfully!")
+        except Exception as exc:
+            self._login_failed(exc)
 
+        if verify_user:
+            self.verify_user()
+
+    def verify_user(self) -> None:
+        """
+        Confirm the Nubapp JWT belongs to a valid user and mark the session as authenticated.
+
+        Raises:
+            ValueError: If the user information cannot be fetched or validated.
+        """
+        try:
+            self._fetch_user_information()
         except Exception as exc:
-            self.authenticated = False
-            self.user_id = None
-            logger.error(f"Login process failed: {exc}")
-            # Normalize to a consistent login error for callers/tests
-            raise ValueError(ErrorMessages.failed_login()) from exc
+            self._login_failed(exc)
+
+        self.authenticated = True
+        logger.info("Login process completed successfully!")
 
-    def is_session_valid(self) -> bool:
+    def is_session_valid(self, margin: float = 0) -> bool:
         """
-        Check whether the current Nubapp JWT is still valid by probing USER.
+        Check whether the current Nubapp JWT is still valid.
+
+        If the token carries an expiry claim this is decided locally, without a request;
+        otherwise the session is probed against USER.
+
+        Args:
+            margin (float): Seconds for which the token must remain valid.
         """
         if not self.sport_jwt:
             return False
 
+        if self.sport_jwt_expires_at is not None:
+            return time.time() + margin < self.sport_jwt_expires_at
+
         try:
             # At this point self.headers already contains Nubapp Authorization
             response = self.session.post(
@@ -116,6 +158,14 @@ class Authenticator:
             logger.debug(f"Session validation failed: {exc}")
             return False
 
+    def _login_failed(self, exc: Exception) -> NoReturn:
+        """Reset authentication state and raise a normalized login error."""
+        self.authenticated = False
+        self.user_id = None
+        logger.error(f"Login process failed: {exc}")
+        # Normalize to a consistent login error for callers/tests
+        raise ValueError(ErrorMessages.failed_login()) from exc
+
     # ------------------------------------------------------------------
     # Step 1: Resasocial JWT login
     # ------------------------------------------------------------------
@@ -236,6 +286,7 @@ class Authenticator:
 
         self.sport_jwt = data.get("jwt_token")
         self.sport_refresh = data.get("refresh_token")
+        self.sport_jwt_expires_at = _jwt_expiry(self.sport_jwt) if self.sport_jwt else None
 
         if not self.sport_jwt:
             logger.error("No jwt_token found in getSportUserToken response")
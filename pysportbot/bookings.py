@@ -1,12 +1,19 @@
-import json
+from collections.abc import Callable
 
 from .authenticator import Authenticator
 from .endpoints import Endpoints
-from .utils.errors import ErrorMessages
+from .utils.errors import ErrorMessages, SlotAlreadyBookedError, SlotNotBookableYetError, SlotUnavailableError
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Known booking error codes -> (exception type, error message factory, log description)
+_BOOK_ERRORS: dict[int, tuple[type[ValueError], Callable[[], str], str]] = {
+    5: (SlotAlreadyBookedError, ErrorMessages.slot_already_booked, "is already booked"),
+    6: (SlotUnavailableError, ErrorMessages.slot_unavailable, "is not available"),
+    28: (SlotNotBookableYetError, ErrorMessages.slot_not_bookable_yet, "is not bookable yet"),
+}
+
 
 class Bookings:
     """Handles booking and cancellation of activity slots."""
@@ -17,6 +24,8 @@ class Bookings:
         self.session = authenticator.session
         # Nubapp credentials
         self.creds = authenticator.creds
+        # User ID sent with every booking request, resolved once up front
+        self._id_user = self.creds["id_user"]
         # Headers for requests
         self.headers = authenticator.headers
 
@@ -28,17 +37,19 @@ class Bookings:
             slot_id (str): The unique ID of the activity slot.
 
         Raises:
-            ValueError: If the slot is already booked or unavailable.
+            SlotAlreadyBookedError: If the slot is already booked.
+            SlotUnavailableError: If the slot is not available.
+            SlotNotBookableYetError: If the slot is not bookable yet.
             RuntimeError: If an unknown error occurs during booking.
         """
         logger.debug(f"Attempting to book slot {slot_id}...")
 
         # Payload for booking
-        payload = {"id_user": self.creds["id_user"], "id_activity_calendar": slot_id}
+        payload = (("id_user", self._id_user), ("id_activity_calendar", slot_id))
 
         # Send booking request
         response = self.session.post(Endpoints.BOOKING, data=payload, headers=self.headers)
-        response_json = json.loads(response.content.decode("utf-8"))
+        response_json = response.json()
         # Check success directly
         if response_json["success"]:
             logger.debug(f"Successfully booked slot {slot_id}.")
@@ -46,19 +57,15 @@ class Bookings:
             # Handle error cases
             error_code = response_json["error"]  # Now we know it exists when success=False
 
-            if error_code == 5:
-                logger.warning(f"Slot {slot_id} is already booked.")
-                raise ValueError(ErrorMessages.slot_already_booked())
-            elif error_code == 6:
-                logger.warning(f"Slot {slot_id} is not available.")
-                raise ValueError(ErrorMessages.slot_unavailable())
-            elif error_code == 28:
-                logger.warning(f"Slot {slot_id} is not bookable yet.")
-                raise ValueError(ErrorMessages.slot_not_bookable_yet())
-            else:
+            known_error = _BOOK_ERRORS.get(error_code)
+            if known_error is None:
                 logger.error(f"Booking failed with error code: {error_code}")
                 raise RuntimeError(ErrorMessages.unknown_error("booking"))
 
+            error_type, error_message, description = known_error
+            logger.warning(f"Slot {slot_id} {description}.")
+            raise error_type(error_message())
+
     def cancel(self, slot_id: str) -> None:
         """
         Cancel a specific slot by its ID.
@@ -72,11 +79,11 @@ class Bookings:
         logger.debug(f"Attempting to cancel slot {slot_id}...")
 
         # Payload for cancellation
-        payload = {"id_user": self.creds["id_user"], "id_activity_calendar": slot_id}
+        payload = (("id_user", self._id_user), ("id_activity_calendar", slot_id))
 
         # Send cancellation request
         response = self.session.post(Endpoints.CANCELLATION, data=payload, headers=self.headers)
-        response_json = json.loads(response.content.decode("utf-8"))
+        response_json = response.json()
 
         # Handle response
         if response_json["success"]:
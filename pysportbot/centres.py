@@ -4,12 +4,12 @@ import json
 import logging
 
 import pandas as pd
-import requests
 from pandas import DataFrame
 
 from pysportbot.utils.logger import get_logger
 
 from .endpoints import Endpoints
+from .session import Session
 from .utils.errors import ErrorMessages
 
 logger = get_logger(__name__)
@@ -21,7 +21,10 @@ class Centres:
     from the Resasports service.
     """
 
-    def __init__(self, print_centres: bool = False) -> None:
+    def __init__(self, print_centres: bool = False, session: Session | None = None) -> None:
+        # Reuse the bot's session so the connection to the Resasocial API
+        # stays open for the subsequent login requests
+        self.session = (session or Session()).session
         # Coordinates for the bounding box of the world
         # Set to the entire world by default
         self.bounds: dict = {
@@ -54,7 +57,7 @@ class Centres:
         Fetches the info of available centres from Resasports and returns a DataFrame.
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 Endpoints.CENTRE,
                 json=self.bounds,
                 timeout=10,
@@ -21,6 +21,11 @@ def main() -> None:
         default=-1,
         help="Maxium number of threads to use for booking. -1 defaults to all available cores.",
     )
+    parser.add_argument(
+        "--precise-timing",
+        action="store_true",
+        help="Busy-wait the final moments before execution to fire bookings with sub-millisecond precision.",
+    )
     args = parser.parse_args()
 
     config: dict[str, Any] = load_config(args.config)
@@ -32,6 +37,7 @@ def main() -> None:
         time_zone=args.time_zone,
         log_level=args.log_level,
         max_threads=args.max_threads,
+        precise_timing=args.precise_timing,
     )
 
 
@@ -1,3 +1,4 @@
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
@@ -6,13 +7,73 @@ from typing import Any
 import pytz
 
 from pysportbot import SportBot
-from pysportbot.utils.errors import ErrorMessages
+from pysportbot.utils.errors import SlotAlreadyBookedError, SlotCapacityFullError, SlotNotBookableYetError
 from pysportbot.utils.logger import get_logger
 
 from .scheduling import calculate_class_day, calculate_next_execution
 
 logger = get_logger(__name__)
 
+# How long before the deadline sleep_until switches from sleeping to spinning
+SPIN_SECONDS = 0.05
+
+# How long before execution the connection to the booking API is warmed up
+WARMUP_LEAD_SECONDS = 2
+
+# How long the session must remain valid after the pre-booking check to skip re-authentication
+REAUTH_MARGIN_SECONDS = 120
+
+# While a slot is not bookable yet, booking is retried after a delay doubling from
+# NOT_BOOKABLE_BASE_DELAY up to NOT_BOOKABLE_MAX_DELAY seconds, at most NOT_BOOKABLE_RETRIES times
+NOT_BOOKABLE_RETRIES = 20
+NOT_BOOKABLE_BASE_DELAY = 0.02
+NOT_BOOKABLE_MAX_DELAY = 0.5
+
+
+def sleep_until(deadline: float, spin_seconds: float = SPIN_SECONDS) -> None:
+    """
+    Block until a time.perf_counter() deadline with sub-millisecond precision.
+
+    time.sleep() may overshoot by several milliseconds, so sleep until shortly
+    before the deadline and busy-wait for the rest.
+
+    Args:
+        deadline (float): Target time on the time.perf_counter() clock.
+        spin_seconds (float): Final stretch, in seconds, spent busy-waiting.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_seconds:
+        time.sleep(remaining - spin_seconds)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def book_when_bookable(bot: SportBot, activity: str, start_time: str) -> None:
+    """
+    Book a slot, polling it with a short exponential backoff while it is not bookable yet.
+
+    Booking usually opens within moments of the execution time, so these retries are
+    much faster than the regular retry delay and do not count as failed attempts.
+
+    Args:
+        bot (SportBot): The SportBot instance.
+        activity (str): Activity name.
+        start_time (str): Slot start time in 'YYYY-MM-DD HH:MM:SS' format.
+    """
+    for retry in range(NOT_BOOKABLE_RETRIES):
+        try:
+            bot._book(activity=activity, start_time=start_time)
+        except SlotNotBookableYetError:
+            pass
+        else:
+            return
+
+        delay = min(NOT_BOOKABLE_BASE_DELAY * 2**retry, NOT_BOOKABLE_MAX_DELAY)
+        logger.debug(f"Slot not bookable yet; retrying in {delay:.2f} seconds.")
+        time.sleep(delay)
+
+    bot._book(activity=activity, start_time=start_time)
+
 
 def attempt_booking(
     bot: SportBot,
@@ -35,23 +96,20 @@ def attempt_booking(
         retry_delay (int): Delay between retries.
         time_zone (str): Time zone for execution.
     """
-    for attempt_num in range(1, retry_attempts + 1):
-        booking_date = calculate_class_day(class_day, time_zone).strftime("%Y-%m-%d")
+    # Resolve the class date once: retries must target the same class even if
+    # they run past midnight, and the day lookup does not need repeating
+    booking_date = calculate_class_day(class_day, time_zone).strftime("%Y-%m-%d")
 
+    for attempt_num in range(1, retry_attempts + 1):
         try:
-            bot.book(activity=activity, start_time=f"{booking_date} {class_time}")
+            book_when_bookable(bot, activity, f"{booking_date} {class_time}")
 
+        # Retrying cannot help when the slot is already ours or booked out
+        except (SlotAlreadyBookedError, SlotCapacityFullError) as e:
+            logger.warning(f"Attempt {attempt_num} failed: {e} Skipping further retries.")
+            return
         except Exception as e:
-            error_str = str(e)
-            logger.warning(f"Attempt {attempt_num} failed: {error_str}")
-
-            # Decide whether to retry based on the error message
-            if ErrorMessages.slot_already_booked() in error_str:
-                logger.warning("Slot already booked; skipping further retries.")
-                return
-            if ErrorMessages.slot_capacity_full() in error_str:
-                logger.warning("Slot capacity full; skipping further retries.")
-                return
+            logger.warning(f"Attempt {attempt_num} failed: {e}")
 
             if attempt_num < retry_attempts:
                 logger.info(f"Retrying in {retry_delay} seconds...")
@@ -64,6 +122,60 @@ def attempt_booking(
     logger.error(f"Failed to book '{activity}' at {class_time} on {booking_date} after {retry_attempts} attempts.")
 
 
+def reauthenticate(bot: SportBot, config: dict[str, Any]) -> None:
+    """
+    Log in again unless the bot's current session remains valid for REAUTH_MARGIN_SECONDS.
+
+    Failures are logged rather than raised so that the booking attempt can still proceed.
+
+    Args:
+        bot (SportBot): The SportBot instance.
+        config (dict): Configuration dictionary with the login credentials.
+    """
+    try:
+        if bot._auth and bot._auth.is_session_valid(margin=REAUTH_MARGIN_SECONDS):
+            logger.info("Session still valid. Skipping re-authentication.")
+        else:
+            logger.info("Attempting re-authenticating before booking.")
+            bot.login(config["email"], config["password"], config["centre"])
+
+    except Exception as e:
+        logger.warning(f"Re-authentication failed before booking execution with {e}.")
+
+
+def wait_for_execution(bot: SportBot, execution_time: datetime, time_zone: str, precise_timing: bool = False) -> None:
+    """
+    Wait until the booking execution time.
+
+    Idle keep-alive connections are often closed by the server, so the connection to
+    the booking API is re-opened shortly before execution to keep the TLS handshake
+    out of the booking window. The warm-up runs in the background so that a slow or
+    retried request cannot push the wait past the execution time.
+
+    Args:
+        bot (SportBot): The SportBot instance.
+        execution_time (datetime): Timezone-aware booking execution time.
+        time_zone (str): Timezone for booking.
+        precise_timing (bool): Busy-wait the last moments before execution for sub-millisecond precision.
+    """
+    now = datetime.now(pytz.timezone(time_zone))
+    remaining_time = (execution_time - now).total_seconds()
+
+    if remaining_time > WARMUP_LEAD_SECONDS:
+        logger.info(f"Waiting {remaining_time:.2f} seconds until booking execution.")
+        time.sleep(remaining_time - WARMUP_LEAD_SECONDS)
+        threading.Thread(target=bot.warm_up, daemon=True).start()
+        now = datetime.now(pytz.timezone(time_zone))
+        remaining_time = (execution_time - now).total_seconds()
+    elif remaining_time > 0:
+        logger.info(f"Waiting {remaining_time:.2f} seconds until booking execution.")
+
+    if precise_timing:
+        sleep_until(time.perf_counter() + remaining_time)
+    else:
+        time.sleep(max(0, remaining_time))
+
+
 def schedule_bookings(
     bot: SportBot,
     config: dict[str, Any],
@@ -72,6 +184,7 @@ def schedule_bookings(
     retry_delay: int,
     time_zone: str,
     max_threads: int,
+    precise_timing: bool = False,
 ) -> None:
     """
     Execute bookings in parallel with a limit on the number of threads.
@@ -85,6 +198,7 @@ def schedule_bookings(
         retry_delay (int): Delay between retries.
         time_zone (str): Timezone for booking.
         max_threads (int): Maximum number of threads to use.
+        precise_timing (bool): Busy-wait the last moments before execution for sub-millisecond precision.
     """
     # Log planned bookings
     for cls in config["classes"]:
@@ -117,22 +231,10 @@ def schedule_bookings(
             time.sleep(reauth_time)
 
         # Re-authenticate before booking if necessary
-        try:
-            if bot._auth and bot._auth.is_session_valid():
-                logger.info("Session still valid. Skipping re-authentication.")
-            else:
-                logger.info("Attempting re-authenticating before booking.")
-                bot.login(config["email"], config["password"], config["centre"])
-
-        except Exception as e:
-            logger.warning(f"Re-authentication failed before booking execution with {e}.")
+        reauthenticate(bot, config)
 
         # Wait the remaining time until execution
-        now = datetime.now(pytz.timezone(time_zone))
-        remaining_time = (execution_time - now).total_seconds()
-        if remaining_time > 0:
-            logger.info(f"Waiting {remaining_time:.2f} seconds until booking execution.")
-        time.sleep(max(0, remaining_time))
+        wait_for_execution(bot, execution_time, time_zone, precise_timing)
 
     # Global booking delay
     if booking_delay > 0:
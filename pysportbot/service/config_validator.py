@@ -1,9 +1,9 @@
-from datetime import datetime
 from typing import Any
 
 from pysportbot import SportBot
 from pysportbot.utils.errors import ErrorMessages
 from pysportbot.utils.logger import get_logger
+from pysportbot.utils.time import parse_time_of_day
 
 logger = get_logger(__name__)
 
@@ -38,36 +38,76 @@ def validate_config(config: dict[str, Any]) -> None:
                 raise_invalid_booking_format_error()
 
             _, exec_time = day_and_time
-            datetime.strptime(exec_time, "%H:%M:%S")
+            parse_time_of_day(exec_time)
         except ValueError:
             raise_invalid_booking_format_error()
 
     # Validate individual class definitions
     for cls in config["classes"]:
-        if "activity" not in cls or "class_day" not in cls or "class_time" not in cls:
-            raise ValueError(ErrorMessages.invalid_class_definition())
+        validate_class(cls)
+
+
+def validate_class(cls: dict[str, Any]) -> None:
+    """
+    Validate a single class definition.
+
+    The day and time are checked here so that a typo fails at start-up
+    rather than when the booking window opens.
+
+    Args:
+        cls (Dict[str, Any]): Class definition with 'activity', 'class_day' and 'class_time'.
+
+    Raises:
+        ValueError: If the class definition is invalid.
+    """
+    if "activity" not in cls or "class_day" not in cls or "class_time" not in cls:
+        raise ValueError(ErrorMessages.invalid_class_definition())
+
+    if cls["class_day"].lower().strip() not in DAY_MAP:
+        raise ValueError(ErrorMessages.invalid_class_day(cls["class_day"]))
+
+    try:
+        parse_time_of_day(cls["class_time"])
+    except ValueError as err:
+        raise ValueError(ErrorMessages.invalid_class_time(cls["class_time"])) from err
 
 
 def validate_activities(bot: SportBot, config: dict[str, Any]) -> None:
     """
     Validate that all activities specified in the configuration exist.
 
+    Activity names are matched exactly first and otherwise case-insensitively,
+    in which case they are rewritten in the configuration to the exact name
+    used by the centre.
+
     Args:
         bot (SportBot): The SportBot instance.
         config (Dict[str, Any]): Configuration dictionary.
 
     Raises:
-        ValueError: If an activity is not found.
+        ValueError: If an activity is not found or its name matches several activities.
     """
     logger.info("Fetching available activities for validation...")
-    available_activities = bot.activities()
-    available_activity_names = set(available_activities["name_activity"].tolist())
+    available_activity_names = bot.activities()["name_activity"].tolist()
+    # Map normalized names to the names expected by the booking API; catalogue
+    # names may differ only in case, so keep every candidate
+    activity_names_by_key: dict[str, list[str]] = {}
+    for name in available_activity_names:
+        activity_names_by_key.setdefault(name.casefold(), []).append(name)
 
     logger.debug(f"Available activities: {available_activity_names}")
 
+    exact_names = set(available_activity_names)
     for cls in config["classes"]:
         activity_name = cls["activity"]
-        if activity_name not in available_activity_names:
-            raise ValueError(ErrorMessages.activity_not_found(activity_name, list(available_activity_names)))
+        if activity_name in exact_names:
+            continue
+        candidates = activity_names_by_key.get(activity_name.casefold())
+        if candidates is None:
+            raise ValueError(ErrorMessages.activity_not_found(activity_name, available_activity_names))
+        if len(candidates) > 1:
+            raise ValueError(ErrorMessages.ambiguous_activity(activity_name, candidates))
+        logger.info(f"Using activity '{candidates[0]}' for configured activity '{activity_name}'.")
+        cls["activity"] = candidates[0]
 
     logger.info("All activities in the configuration file have been validated.")
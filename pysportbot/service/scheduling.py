@@ -2,6 +2,8 @@ from datetime import datetime, timedelta
 
 import pytz
 
+from pysportbot.utils.time import parse_time_of_day
+
 from .config_validator import DAY_MAP
 
 
@@ -30,7 +32,7 @@ def calculate_next_execution(booking_execution: str, time_zone: str = "Europe/Ma
     current_weekday = now.weekday()
 
     # Parse the execution time
-    exec_time = datetime.strptime(execution_time, "%H:%M:%S").time()
+    exec_time = parse_time_of_day(execution_time)
 
     # Determine the next execution date
     if day_of_week_target == current_weekday and now.time() < exec_time:
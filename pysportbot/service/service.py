@@ -15,6 +15,7 @@ def run_service(
     time_zone: str = "Europe/Madrid",
     log_level: str = "INFO",
     max_threads: int = -1,
+    precise_timing: bool = False,
 ) -> None:
     """
     Run the booking service with the given configuration.
@@ -23,9 +24,11 @@ def run_service(
         config (dict): Configuration dictionary for booking service.
         booking_delay (int): Delay before each booking attempt.
         retry_attempts (int): Number of retry attempts.
-        retry_delay (int): Delay between retry attempts in minutes.
+        retry_delay (int): Delay between retry attempts in seconds.
         time_zone (str): Time zone for the booking.
         log_level (str): Logging level for the service.
+        max_threads (int): Maximum number of booking threads (-1 for all available cores).
+        precise_timing (bool): Busy-wait the last moments before execution for sub-millisecond precision.
     """
     # Initialize logger
     logger = get_logger(__name__)
@@ -56,6 +59,7 @@ def run_service(
         retry_delay,
         time_zone,
         max_threads,
+        precise_timing,
     )
 
     logger.info("All bookings completed.")
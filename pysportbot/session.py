@@ -1,4 +1,7 @@
+import os
+
 from requests import Session as RequestsSession
+from requests.adapters import HTTPAdapter, Retry
 
 from .utils.logger import get_logger
 
@@ -11,6 +14,24 @@ class Session:
     def __init__(self) -> None:
         """Initialize a new session and set default headers."""
         self.session: RequestsSession = RequestsSession()
+        # Keep connections to the Resasocial and Nubapp hosts alive across requests
+        # and transparently retry transient gateway errors on idempotent requests
+        # only: a retried booking POST may already have gone through. Retry-After
+        # is ignored so that a 503 cannot stall a booking thread. The service books
+        # with at most one thread per core, so size the per-host pool to match.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(8, os.cpu_count() or 1),
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
         self.headers: dict[str, str] = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:133.0) Gecko/20100101 Firefox/133.0",
             "Accept": "application/json, text/plain, */*",
@@ -37,6 +58,20 @@ class Session:
         self.headers[key] = value
         logger.debug(f"Header updated: {key} = {value}")
 
+    def warm_up(self, url: str, timeout: float = 2) -> None:
+        """
+        Open (or refresh) a pooled connection to a host ahead of time-critical requests.
+
+        Args:
+            url (str): Any URL on the host to connect to.
+            timeout (float): Timeout in seconds for the request.
+        """
+        try:
+            self.session.head(url, headers=self.headers, timeout=timeout)
+            logger.debug(f"Connection warmed up: {url}")
+        except Exception as exc:
+            logger.debug(f"Connection warm-up failed for {url}: {exc}")
+
     def get_session(self) -> RequestsSession:
         """
         Get the underlying Requests session object.
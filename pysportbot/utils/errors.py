@@ -1,6 +1,22 @@
 import logging
 
 
+class SlotAlreadyBookedError(ValueError):
+    """Raised when booking a slot the user has already booked."""
+
+
+class SlotUnavailableError(ValueError):
+    """Raised when booking a slot that is not available."""
+
+
+class SlotNotBookableYetError(ValueError):
+    """Raised when booking a slot whose booking window has not opened yet."""
+
+
+class SlotCapacityFullError(ValueError):
+    """Raised when booking a slot that is booked out."""
+
+
 class ErrorMessages:
     """Centralized error messages for the application."""
 
@@ -22,6 +38,14 @@ class ErrorMessages:
     def invalid_class_definition() -> str:
         return "Each class must include 'activity', 'class_day', 'class_time'"
 
+    @staticmethod
+    def invalid_class_day(class_day: str) -> str:
+        return f"Invalid class_day '{class_day}'. Use a weekday name such as 'Monday'."
+
+    @staticmethod
+    def invalid_class_time(class_time: str) -> str:
+        return f"Invalid class_time '{class_time}'. Use 'HH:MM:SS'."
+
     @staticmethod
     def invalid_booking_execution_format() -> str:
         return "Invalid booking_execution format. Use 'now' or 'Day HH:MM:SS'."
@@ -85,6 +109,14 @@ class ErrorMessages:
             f"Available activities are: {', '.join(available_activities)}."
         )
 
+    @staticmethod
+    def ambiguous_activity(activity_name: str, matching_activities: list) -> str:
+        """Return an error message for an activity name matching several activities."""
+        return (
+            f"The activity name '{activity_name}' matches several activities: "
+            f"{', '.join(matching_activities)}. Please use the exact name."
+        )
+
     @staticmethod
     def no_slots(activity_name: str, day: str) -> str:
         """Return a warning message when no slots are available."""
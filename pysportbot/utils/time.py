@@ -22,6 +22,29 @@ def get_day_bounds(date_string: str, fmt: str = "%Y-%m-%d", tz: str = "UTC") ->
     return start.strftime(fmt), end.strftime(fmt)
 
 
+def parse_time_of_day(time_string: str) -> time:
+    """
+    Parse a time of day in 'HH:MM:SS' format.
+
+    Equivalent to datetime.strptime(time_string, "%H:%M:%S").time() for this
+    fixed shape, without going through the generic format parser.
+
+    Args:
+        time_string (str): The time in 'HH:MM:SS' format.
+
+    Returns:
+        time: The parsed time of day.
+
+    Raises:
+        ValueError: If the string is not a valid 'HH:MM:SS' time.
+    """
+    parts = time_string.split(":")
+    if len(parts) != 3 or not all(0 < len(part) <= 2 and part.isdigit() for part in parts):
+        raise ValueError(f"time data '{time_string}' does not match format 'HH:MM:SS'")
+    hours, minutes, seconds = parts
+    return time(int(hours), int(minutes), int(seconds))
+
+
 def get_unix_day_bounds(date_string: str, fmt: str = "%Y-%m-%d", tz: str = "UTC") -> tuple[int, int]:
     """
     Get the Unix timestamp bounds for a given day.
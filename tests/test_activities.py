@@ -1,9 +1,14 @@
+import pytest
+
+
+@pytest.mark.integration
 def test_fetch_activities(bot):
     """Test fetching activities."""
     activities = bot.activities(limit=5)
     assert not activities.empty, "No activities fetched. Check server or credentials."
 
 
+@pytest.mark.integration
 def test_activities_columns(bot):
     """Test that activities contain expected columns."""
     activities = bot.activities(limit=1)
@@ -1,20 +1,45 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
 
-from pysportbot.utils.errors import ErrorMessages
+import pandas as pd
+import pytest
 
+from pysportbot import SportBot
+from pysportbot.bookings import Bookings
+from pysportbot.utils.errors import (
+    ErrorMessages,
+    SlotAlreadyBookedError,
+    SlotCapacityFullError,
+    SlotNotBookableYetError,
+    SlotUnavailableError,
+)
 
+
+def _days_until_friday(weekday):
+    """Return the days until next Friday, in 1..7 (if today is Friday, book for next week)."""
+    return (3 - weekday) % 7 + 1
+
+
+@pytest.mark.parametrize("weekday", range(7))
+def test_days_until_friday(weekday):
+    """Test that the one-expression day count matches the modulo with a zero-to-seven fix-up."""
+    expected = (4 - weekday) % 7
+    if expected == 0:
+        expected = 7
+    assert _days_until_friday(weekday) == expected
+
+
+@pytest.mark.integration
 def test_book_and_cancel_activity(bot):
     """Test booking and canceling a Gimnasio session on the upcoming Friday."""
 
     # Determine the upcoming Friday from today
     today = datetime.now()
-    # Calculate the days until next Friday (if today is Friday, book for next week)
-    days_until_friday = (4 - today.weekday()) % 7
-    # Ensure that if it's already Friday, we move to the next Friday (7 days later)
-    if days_until_friday == 0:
-        days_until_friday = 7
+    days_until_friday = _days_until_friday(today.weekday())
     upcoming_friday = today + timedelta(days=days_until_friday)
-    friday_str = upcoming_friday.strftime("%Y-%m-%d")
+    friday_str = upcoming_friday.date().isoformat()
 
     # Fetch available slots for 'Gimnasio' on upcoming Friday
     slots = bot.daily_slots("Gimnasio", friday_str)
@@ -22,25 +47,145 @@ def test_book_and_cancel_activity(bot):
 
     # Book the first available slot
     booked_slot = None
-    for _, slot in slots.iterrows():
+    for start_timestamp in slots["start_timestamp"].tolist():
         try:
-            bot.book("Gimnasio", slot["start_timestamp"])
-            booked_slot = slot["start_timestamp"]
+            bot._book("Gimnasio", start_timestamp)
+            booked_slot = start_timestamp
             break
-        except ValueError as e:
-            # If the slot is already booked, unavailable, or not yet open, move on
-            if str(e) in [
-                ErrorMessages.slot_already_booked(),
-                ErrorMessages.slot_unavailable(),
-                ErrorMessages.slot_not_bookable_yet(),
-                ErrorMessages.slot_capacity_full(),
-            ]:
-                continue
-            raise
+        except (SlotAlreadyBookedError, SlotUnavailableError, SlotNotBookableYetError, SlotCapacityFullError):
+            # If the slot is already booked, unavailable, full, or not yet open, move on
+            continue
 
     assert booked_slot is not None, f"No bookable Gimnasio slots found on {friday_str}"
 
     # Cancel the booking
     bot.cancel("Gimnasio", booked_slot)
-    # Simple success assertion—if cancel fails, an exception should be raised
-    assert True, f"Failed to cancel Gimnasio slot at {booked_slot}"
+
+
+def _offline_bot(slots):
+    """Create a logged-in SportBot whose managers are mocked out."""
+    with patch("pysportbot.centres.Centres.fetch_centres", return_value=pd.DataFrame({"slug": ["centre1"]})):
+        bot = SportBot()
+    bot._is_logged_in = True
+    bot._auth = MagicMock()
+    bot._df_activities = pd.DataFrame({"name_activity": ["Gimnasio"], "id_activity": [1]})
+    bot._activities = MagicMock()
+    bot._activities.daily_slots.return_value = slots
+    bot._bookings = MagicMock()
+    return bot
+
+
+def test_book_and_cancel_reuse_cached_slots():
+    """Test that book/cancel reuse cached daily slots and invalidate them after a booking change."""
+    slots = pd.DataFrame(
+        {
+            "id_activity_calendar": [101],
+            "start_timestamp": ["2025-01-10 10:00:00"],
+            "n_inscribed": [1],
+            "n_capacity": [10],
+        }
+    )
+    bot = _offline_bot(slots)
+
+    bot.daily_slots("Gimnasio", "2025-01-10")
+    bot.book("Gimnasio", "2025-01-10 10:00:00")
+    # Slots came from the cache, so only the explicit daily_slots call hit the server
+    assert bot._activities.daily_slots.call_count == 1
+    bot._bookings.book.assert_called_once_with(101)
+
+    bot.cancel("Gimnasio", "2025-01-10 10:00:00")
+    # The successful booking invalidated the cache
+    assert bot._activities.daily_slots.call_count == 2
+    bot._bookings.cancel.assert_called_once_with(101)
+
+
+def test_book_raises_booking_errors():
+    """Test that booking errors are raised internally, invalidate stale slots, and are only logged by book/cancel."""
+    slots = pd.DataFrame(
+        {
+            "id_activity_calendar": [101],
+            "start_timestamp": ["2025-01-10 10:00:00"],
+            "n_inscribed": [1],
+            "n_capacity": [10],
+        }
+    )
+    bot = _offline_bot(slots)
+    bot._bookings.book.side_effect = SlotNotBookableYetError(ErrorMessages.slot_not_bookable_yet())
+
+    with pytest.raises(SlotNotBookableYetError, match=ErrorMessages.slot_not_bookable_yet()):
+        bot._book("Gimnasio", "2025-01-10 10:00:00")
+    # The slot is not open yet, so the cached slots remain valid
+    assert ("Gimnasio", "2025-01-10") in bot._slots_cache
+
+    bot._bookings.book.side_effect = SlotUnavailableError(ErrorMessages.slot_unavailable())
+    with pytest.raises(SlotUnavailableError, match=ErrorMessages.slot_unavailable()):
+        bot._book("Gimnasio", "2025-01-10 10:00:00")
+    # Any other failure may mean the occupancy changed, so the cache is dropped
+    assert ("Gimnasio", "2025-01-10") not in bot._slots_cache
+
+    # The public methods log server-side failures instead of raising them
+    bot.book("Gimnasio", "2025-01-10 10:00:00")
+    bot._bookings.cancel.side_effect = ValueError(ErrorMessages.cancellation_failed())
+    bot.cancel("Gimnasio", "2025-01-10 10:00:00")
+
+
+def test_book_refreshes_cached_slots_when_full():
+    """Test that a slot reported full by the cache is re-checked against fresh slots."""
+    full_slots = pd.DataFrame(
+        {
+            "id_activity_calendar": [101],
+            "start_timestamp": ["2025-01-10 10:00:00"],
+            "n_inscribed": [10],
+            "n_capacity": [10],
+        }
+    )
+    bot = _offline_bot(full_slots)
+    bot.daily_slots("Gimnasio", "2025-01-10")
+
+    bot._activities.daily_slots.return_value = full_slots.assign(n_inscribed=[9])
+    bot.book("Gimnasio", "2025-01-10 10:00:00")
+
+    assert bot._activities.daily_slots.call_count == 2
+    bot._bookings.book.assert_called_once_with(101)
+
+
+def test_parallel_bookings_share_one_slots_fetch():
+    """Test that concurrent bookings for the same activity and day fetch the daily slots only once."""
+    slots = pd.DataFrame(
+        {
+            "id_activity_calendar": [101, 102],
+            "start_timestamp": ["2025-01-10 10:00:00", "2025-01-10 11:00:00"],
+            "n_inscribed": [1, 1],
+            "n_capacity": [10, 10],
+        }
+    )
+    bot = _offline_bot(slots)
+
+    def slow_daily_slots(*args):
+        time.sleep(0.05)
+        return slots
+
+    bot._activities.daily_slots.side_effect = slow_daily_slots
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(bot._find_slot, ["Gimnasio"] * 2, ["2025-01-10 10:00:00", "2025-01-10 11:00:00"]))
+
+    assert bot._activities.daily_slots.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "error_code, expected_exception, expected_message",
+    [
+        (5, SlotAlreadyBookedError, ErrorMessages.slot_already_booked()),
+        (6, SlotUnavailableError, ErrorMessages.slot_unavailable()),
+        (28, SlotNotBookableYetError, ErrorMessages.slot_not_bookable_yet()),
+        (99, RuntimeError, ErrorMessages.unknown_error("booking")),
+    ],
+)
+def test_bookings_book_error_codes(error_code, expected_exception, expected_message):
+    """Test that booking error codes map to the expected exceptions."""
+    authenticator = MagicMock()
+    authenticator.creds = {"id_user": "1"}
+    authenticator.session.post.return_value.json.return_value = {"success": False, "error": error_code}
+
+    with pytest.raises(expected_exception, match=expected_message):
+        Bookings(authenticator).book("101")
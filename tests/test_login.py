@@ -1,12 +1,20 @@
 # test_login.py
 
+import base64
+import json
+import time
+from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
 from pysportbot import SportBot
+from pysportbot.authenticator import Authenticator
+from pysportbot.session import Session
 from pysportbot.utils.errors import ErrorMessages
 
 
+@pytest.mark.integration
 def test_bot_login_success(bot):
     """
     Test that the SportBot successfully logs in using valid credentials.
@@ -14,6 +22,7 @@ def test_bot_login_success(bot):
     assert bot.is_logged_in(), "SportBot failed to log in with valid credentials."
 
 
+@pytest.mark.integration
 def test_login_with_invalid_centre_raises_error():
     """
     Test that logging in with an invalid centre raises a ValueError with the correct message.
@@ -25,6 +34,7 @@ def test_login_with_invalid_centre_raises_error():
         bot.login("test@example.com", "somepassword", invalid_centre)
 
 
+@pytest.mark.integration
 def test_login_with_invalid_credentials_raises_error():
     """
     Test that logging in with invalid credentials raises an Exception with the correct message.
@@ -33,3 +43,53 @@ def test_login_with_invalid_credentials_raises_error():
 
     with pytest.raises(Exception, match=ErrorMessages.login_failed()):
         bot.login("invalid_email@example.com", "wrong_password", "kirolklub")
+
+
+def test_relogin_reuses_recent_activities():
+    """
+    Test that logging in again to the same centre reuses the activity catalogue instead of refetching it.
+    """
+    with patch("pysportbot.centres.Centres.fetch_centres", return_value=pd.DataFrame({"slug": ["centre1"]})):
+        bot = SportBot()
+
+    df_activities = pd.DataFrame({"name_activity": ["Yoga"], "id_activity": [1]})
+    with (
+        patch("pysportbot.Authenticator"),
+        patch("pysportbot.activities.Activities") as mock_activities,
+    ):
+        mock_activities.return_value.fetch.return_value = df_activities
+        bot.login("test@example.com", "somepassword", "centre1")
+        bot._slots_lock(("Yoga", "2025-01-10"))
+        bot.login("test@example.com", "somepassword", "centre1")
+
+    assert bot.is_logged_in()
+    mock_activities.return_value.fetch.assert_called_once()
+    assert bot.activities().equals(df_activities)
+    # Slot fetch locks from the previous login are released
+    assert not bot._slots_locks
+
+
+def test_session_validity_uses_jwt_expiry():
+    """
+    Test that a Nubapp JWT with an expiry claim is validated locally, honouring the margin,
+    and that tokens without one fall back to probing the server.
+    """
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 300}).encode()).decode().rstrip("=")
+    auth = Authenticator(Session(), "centre1")
+    auth.id_user, auth.id_application, auth.resasocial_jwt = "1", "2", "resasocial-jwt"
+
+    with patch.object(auth.session, "get") as mock_get, patch.object(auth.session, "post") as mock_post:
+        mock_get.return_value.status_code = 200
+        mock_post.return_value.status_code = 401
+
+        mock_get.return_value.json.return_value = {"jwt_token": "opaque-token"}
+        auth._get_sport_user_token()
+        assert not auth.is_session_valid()
+        mock_post.assert_called_once()
+
+        mock_post.reset_mock()
+        mock_get.return_value.json.return_value = {"jwt_token": f"header.{claims}.signature"}
+        auth._get_sport_user_token()
+        assert auth.is_session_valid(margin=120)
+        assert not auth.is_session_valid(margin=600)
+        mock_post.assert_not_called()
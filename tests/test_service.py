@@ -1,12 +1,15 @@
 import json
+import os
+import tempfile
+import time
 import unittest
-from datetime import datetime
-from unittest.mock import MagicMock, call, mock_open, patch
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, call, patch
 
 import pandas as pd
 import pytz
 
-from pysportbot.service.booking import attempt_booking, schedule_bookings
+from pysportbot.service.booking import attempt_booking, schedule_bookings, sleep_until, wait_for_execution
 
 # Adjust these imports to match your actual project structure:
 from pysportbot.service.config_loader import load_config
@@ -14,7 +17,7 @@ from pysportbot.service.config_validator import DAY_MAP, validate_activities, va
 from pysportbot.service.scheduling import calculate_class_day, calculate_next_execution
 from pysportbot.service.service import run_service
 from pysportbot.service.threading import get_n_threads
-from pysportbot.utils.errors import ErrorMessages
+from pysportbot.utils.errors import ErrorMessages, SlotAlreadyBookedError, SlotNotBookableYetError
 
 
 class TestConfigLoader(unittest.TestCase):
@@ -22,39 +25,48 @@ class TestConfigLoader(unittest.TestCase):
     Tests for config_loader.py module.
     """
 
+    def setUp(self):
+        """
+        Provide a path to a config file in a temporary directory.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.config_path = os.path.join(tmp_dir.name, "config.json")
+
     def test_load_config_valid_file(self):
         """
         Test load_config with a valid JSON file.
         """
-        fake_json = json.dumps(
-            {
-                "email": "test@example.com",
-                "password": "secret",
-                "centre": "my-gim",
-                "classes": [],
-                "booking_execution": "now",
-            }
-        )
-        with patch("builtins.open", mock_open(read_data=fake_json)), patch("os.path.exists", return_value=True):
-            config = load_config("fake_config_path.json")
-            self.assertIn("email", config)
-            self.assertEqual(config["email"], "test@example.com")
+        with open(self.config_path, "w") as f:
+            json.dump(
+                {
+                    "email": "test@example.com",
+                    "password": "secret",
+                    "centre": "my-gim",
+                    "classes": [],
+                    "booking_execution": "now",
+                },
+                f,
+            )
+        config = load_config(self.config_path)
+        self.assertIn("email", config)
+        self.assertEqual(config["email"], "test@example.com")
 
     def test_load_config_file_not_found(self):
         """
         Test load_config if the file does not exist.
         """
         with self.assertRaises(FileNotFoundError):
-            load_config("non_existent_config.json")
+            load_config(self.config_path)
 
     def test_load_config_invalid_json(self):
         """
         Test load_config with an invalid JSON structure.
         """
-        invalid_data = "{invalid_json: True unquoted_value}"
-        # Combine into one 'with' to fix SIM117
-        with patch("builtins.open", mock_open(read_data=invalid_data)), self.assertRaises(json.JSONDecodeError):
-            load_config("fake_config_path.json")
+        with open(self.config_path, "w") as f:
+            f.write("{invalid_json: True unquoted_value}")
+        with self.assertRaises(json.JSONDecodeError):
+            load_config(self.config_path)
 
 
 class TestConfigValidator(unittest.TestCase):
@@ -100,6 +112,26 @@ class TestConfigValidator(unittest.TestCase):
         expected_message = ErrorMessages.invalid_class_definition()
         self.assertIn(expected_message, str(ctx.exception))
 
+    def test_validate_config_invalid_class_day_and_time(self):
+        """
+        Test that validate_config rejects unknown weekdays and malformed class times up front.
+        """
+        config = {
+            "email": "someone@example.com",
+            "password": "secret",
+            "centre": "my-gim",
+            "classes": [{"activity": "Yoga", "class_day": "Funday", "class_time": "10:00:00"}],
+            "booking_execution": "now",
+        }
+        with self.assertRaises(ValueError) as ctx:
+            validate_config(config)
+        self.assertIn(ErrorMessages.invalid_class_day("Funday"), str(ctx.exception))
+
+        config["classes"] = [{"activity": "Yoga", "class_day": "Monday", "class_time": "10h00"}]
+        with self.assertRaises(ValueError) as ctx:
+            validate_config(config)
+        self.assertIn(ErrorMessages.invalid_class_time("10h00"), str(ctx.exception))
+
     def test_validate_config_booking_execution_now(self):
         """
         Test that validate_config allows 'booking_execution' to be 'now' without error.
@@ -165,6 +197,37 @@ class TestConfigValidator(unittest.TestCase):
         expected_message = ErrorMessages.activity_not_found("CrossFit", ["Yoga"])
         self.assertIn(expected_message, str(ctx.exception))
 
+    def test_validate_activities_normalizes_case(self):
+        """
+        Test that validate_activities matches activity names case-insensitively
+        and rewrites them to the centre's exact name.
+        """
+        mock_bot_instance = MagicMock()
+        mock_bot_instance.activities.return_value = pd.DataFrame({"name_activity": ["Yoga", "CrossFit"]})
+
+        config = {"classes": [{"activity": "crossfit", "class_day": "Monday", "class_time": "18:00:00"}]}
+
+        validate_activities(mock_bot_instance, config)
+
+        self.assertEqual(config["classes"][0]["activity"], "CrossFit")
+
+    def test_validate_activities_prefers_exact_name(self):
+        """
+        Test that validate_activities keeps an exact match and rejects names
+        that match several activities only case-insensitively.
+        """
+        mock_bot_instance = MagicMock()
+        mock_bot_instance.activities.return_value = pd.DataFrame({"name_activity": ["Yoga", "YOGA"]})
+
+        config = {"classes": [{"activity": "Yoga", "class_day": "Monday", "class_time": "18:00:00"}]}
+        validate_activities(mock_bot_instance, config)
+        self.assertEqual(config["classes"][0]["activity"], "Yoga")
+
+        config["classes"][0]["activity"] = "yoga"
+        with self.assertRaises(ValueError) as ctx:
+            validate_activities(mock_bot_instance, config)
+        self.assertIn(ErrorMessages.ambiguous_activity("yoga", ["Yoga", "YOGA"]), str(ctx.exception))
+
 
 class TestScheduling(unittest.TestCase):
     """
@@ -346,7 +409,7 @@ class TestBooking(unittest.TestCase):
             call(remaining_time),  # Remaining time after re-auth
             call(10),  # Booking delay
         ]
-        mock_time.sleep.assert_has_calls(expected_sleep_calls, any_order=False)
+        self.assertEqual(mock_time.sleep.call_args_list, expected_sleep_calls)
 
         # Assert session validation was called
         mock_bot._auth.is_session_valid.assert_called_once()
@@ -409,7 +472,7 @@ class TestBooking(unittest.TestCase):
             call(remaining_time),  # Remaining time after session check
             call(10),  # Booking delay
         ]
-        mock_time.sleep.assert_has_calls(expected_sleep_calls, any_order=False)
+        self.assertEqual(mock_time.sleep.call_args_list, expected_sleep_calls)
 
         # Assert session validation was called
         mock_bot._auth.is_session_valid.assert_called_once()
@@ -472,7 +535,7 @@ class TestBooking(unittest.TestCase):
             call(remaining_time),
             call(10),
         ]
-        mock_time.sleep.assert_has_calls(expected_sleep_calls, any_order=False)
+        self.assertEqual(mock_time.sleep.call_args_list, expected_sleep_calls)
 
         # Assert session validation was attempted
         mock_bot._auth.is_session_valid.assert_called_once()
@@ -495,26 +558,24 @@ class TestBooking(unittest.TestCase):
         mock_datetime_sched.now.return_value = mock_now
 
         mock_bot = MagicMock()
-        # The returned daily_slots matches the requested "18:00:00" on 2024-01-10
-        mock_bot.daily_slots.return_value = pd.DataFrame({"start_timestamp": ["2024-01-10 18:00:00"]})
 
         attempt_booking(
             bot=mock_bot,
             activity="Yoga",
-            class_day="Wednesday",  # This maps to 2024-01-10 from our patch
+            class_day="Wednesday",
             class_time="18:00:00",
             retry_attempts=3,
             retry_delay=1,
             time_zone="Europe/Madrid",
         )
-        # If a slot matches, we book exactly once
-        mock_bot.book.assert_called_once()
+        # Classes are always booked for the upcoming week, so the Wednesday slot on 2024-01-17 is booked once
+        mock_bot._book.assert_called_once_with(activity="Yoga", start_time="2024-01-17 18:00:00")
 
     @patch("pysportbot.service.booking.logger")
     @patch("pysportbot.service.scheduling.datetime", wraps=datetime)
     def test_attempt_booking_no_matching_slots(self, mock_datetime_sched, mock_logger):
         """
-        If no matching slot is found, attempt_booking should call the bot.book()
+        If no matching slot is found, attempt_booking should call the bot._book()
         method, which will raise an exception internally, and log warnings on each attempt.
         """
         # Make the current date 2024-01-10 (Wednesday)
@@ -523,8 +584,8 @@ class TestBooking(unittest.TestCase):
         mock_datetime_sched.now.return_value = mock_now
 
         mock_bot = MagicMock()
-        # Mock the bot.book method to simulate a ValueError for no matching slots
-        mock_bot.book.side_effect = ValueError(
+        # Mock the bot._book method to simulate a ValueError for no matching slots
+        mock_bot._book.side_effect = ValueError(
             ErrorMessages.no_matching_slots_for_time("Yoga", "18:00:00", "2024-01-10")
         )
 
@@ -539,7 +600,7 @@ class TestBooking(unittest.TestCase):
         )
 
         # Check that book() was called twice (retry_attempts = 2)
-        self.assertEqual(mock_bot.book.call_count, 2)
+        self.assertEqual(mock_bot._book.call_count, 2)
 
         # On the final attempt, ensure the correct error message was logged
         last_warning = mock_logger.warning.call_args_list[-1][0][0]
@@ -560,9 +621,8 @@ class TestBooking(unittest.TestCase):
         mock_datetime_sched.now.return_value = mock_now
 
         mock_bot = MagicMock()
-        mock_bot.daily_slots.return_value = pd.DataFrame({"start_timestamp": ["2024-01-10 18:00:00"]})
         # First attempt raises 'slot already booked', so we skip subsequent attempts
-        mock_bot.book.side_effect = [ValueError(ErrorMessages.slot_already_booked())]
+        mock_bot._book.side_effect = [SlotAlreadyBookedError(ErrorMessages.slot_already_booked())]
 
         attempt_booking(
             bot=mock_bot,
@@ -573,7 +633,34 @@ class TestBooking(unittest.TestCase):
             retry_delay=1,
             time_zone="Europe/Madrid",
         )
-        mock_bot.book.assert_called_once()  # Should only be called the first time
+        mock_bot._book.assert_called_once()  # Should only be called the first time
+
+    @patch("pysportbot.service.booking.time")
+    @patch("pysportbot.service.booking.logger")
+    @patch("pysportbot.service.scheduling.datetime", wraps=datetime)
+    def test_attempt_booking_polls_until_bookable(self, mock_datetime_sched, mock_logger, mock_time):
+        """
+        If the slot is not bookable yet, poll it with a short exponential backoff without using up retries.
+        """
+        tz = pytz.timezone("Europe/Madrid")
+        mock_datetime_sched.now.return_value = tz.localize(datetime(2024, 1, 10, 10, 0, 0))
+
+        mock_bot = MagicMock()
+        mock_bot._book.side_effect = [SlotNotBookableYetError(ErrorMessages.slot_not_bookable_yet())] * 3 + [None]
+
+        attempt_booking(
+            bot=mock_bot,
+            activity="Yoga",
+            class_day="Wednesday",
+            class_time="18:00:00",
+            retry_attempts=1,
+            retry_delay=60,
+            time_zone="Europe/Madrid",
+        )
+
+        self.assertEqual(mock_bot._book.call_count, 4)
+        self.assertEqual(mock_time.sleep.call_args_list, [call(0.02), call(0.04), call(0.08)])
+        mock_logger.error.assert_not_called()
 
     @patch("pysportbot.service.booking.as_completed")
     @patch("pysportbot.service.booking.ThreadPoolExecutor")
@@ -627,6 +714,68 @@ class TestBooking(unittest.TestCase):
         # but we only need to confirm it wasn't stuck
         self.assertTrue(mock_as_completed.called)
 
+    @patch("pysportbot.service.booking.threading")
+    @patch("pysportbot.service.booking.datetime", wraps=datetime)
+    @patch("pysportbot.service.booking.time")
+    def test_wait_for_execution_warms_up_connection(self, mock_time, mock_datetime, mock_threading):
+        """
+        wait_for_execution should warm up the connection in the background shortly before execution.
+        """
+        tz = pytz.timezone("Europe/Madrid")
+        execution_time = tz.localize(datetime(2024, 1, 8, 10, 0, 0))
+        mock_datetime.now.side_effect = [
+            tz.localize(datetime(2024, 1, 8, 9, 59, 30)),  # 30 seconds before execution
+            tz.localize(datetime(2024, 1, 8, 9, 59, 58)),  # after the warm-up lead sleep
+        ]
+        mock_bot = MagicMock()
+
+        wait_for_execution(mock_bot, execution_time, "Europe/Madrid")
+
+        self.assertEqual(mock_time.sleep.call_args_list, [call(28), call(2)])
+        mock_threading.Thread.assert_called_once_with(target=mock_bot.warm_up, daemon=True)
+        mock_threading.Thread.return_value.start.assert_called_once()
+
+    @patch("pysportbot.service.booking.WARMUP_LEAD_SECONDS", 0.2)
+    def test_wait_for_execution_slow_warm_up(self):
+        """
+        A slow warm-up must not delay the end of the wait past the execution time.
+        """
+        mock_bot = MagicMock()
+        mock_bot.warm_up.side_effect = lambda: time.sleep(1)
+        execution_time = datetime.now(pytz.timezone("Europe/Madrid")) + timedelta(seconds=0.4)
+
+        wait_for_execution(mock_bot, execution_time, "Europe/Madrid")
+
+        lateness = (datetime.now(pytz.timezone("Europe/Madrid")) - execution_time).total_seconds()
+        self.assertGreaterEqual(lateness, 0)
+        self.assertLess(lateness, 0.1)
+        mock_bot.warm_up.assert_called_once()
+
+    @patch("pysportbot.service.booking.time")
+    def test_sleep_until_sleeps_then_spins(self, mock_time):
+        """
+        sleep_until should sleep until shortly before the deadline and busy-wait the rest.
+        """
+        # Initial reading, one spin iteration still before the deadline, then past it
+        mock_time.perf_counter.side_effect = [10.0, 10.99, 11.001]
+
+        sleep_until(11.0, spin_seconds=0.05)
+
+        mock_time.sleep.assert_called_once()
+        self.assertAlmostEqual(mock_time.sleep.call_args[0][0], 0.95)
+        self.assertEqual(mock_time.perf_counter.call_count, 3)
+
+    @patch("pysportbot.service.booking.time")
+    def test_sleep_until_past_deadline(self, mock_time):
+        """
+        sleep_until should return immediately when the deadline has already passed.
+        """
+        mock_time.perf_counter.side_effect = [12.0, 12.0]
+
+        sleep_until(11.0)
+
+        mock_time.sleep.assert_not_called()
+
 
 class TestThreading(unittest.TestCase):
     """
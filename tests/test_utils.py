@@ -1,8 +1,25 @@
-def test_time_bounds():
+import pytest
+
+
+@pytest.mark.parametrize("date", ["2024-12-30", "2025-01-01", "2020-02-29"])
+def test_time_bounds(date):
     """Test the time bounds utility."""
     from pysportbot.utils.time import get_unix_day_bounds
 
-    date = "2024-12-30"
     start, end = get_unix_day_bounds(date)
     assert start < end, "Start time is not less than end time."
     assert isinstance(start, int) and isinstance(end, int), "Timestamps are not integers."
+    assert end - start == 86399, "Bounds do not span the whole UTC day."
+
+
+def test_parse_time_of_day():
+    """Test parsing 'HH:MM:SS' times and rejecting malformed ones."""
+    from datetime import time
+
+    from pysportbot.utils.time import parse_time_of_day
+
+    assert parse_time_of_day("07:30:05") == time(7, 30, 5)
+    assert parse_time_of_day("7:30:00") == time(7, 30, 0)
+    for invalid in ["07:30", "07-30-00", "24:00:00", "07:60:00", "+7:30:00", "07:30:00 "]:
+        with pytest.raises(ValueError):
+            parse_time_of_day(invalid)